@@ -1,6 +1,6 @@
 import re
-from yaml_list_helpers.yaml_list_helpers import list_item_to_yaml_str
-from yaml_dict_helpers.yaml_dict_helpers import dict_item_to_yaml_str
+from ..yaml_list_helpers.yaml_list_helpers import list_item_to_yaml_str
+from ..yaml_dict_helpers.yaml_dict_helpers import dict_item_to_yaml_str
 
 def replace_combined_updated_blocks(
     lines_snapshot: list[str],
@@ -1,11 +1,11 @@
 #!/usr/bin/env python3
 
-from date_helper.date_helper import update_dates_in_data
-from yaml_toplevel.yaml_toplevel import get_toplevel_inserts_keys, determine_key_contents
-from yaml_list_helpers.yaml_list_helpers import get_last_list_index_for_key, get_list_item_key_values
-from yaml_dict_helpers.yaml_dict_helpers import get_dict_item_key_values
-from filereadwrite.file_indicies import find_yaml_block_indices_for_combined
-from filereadwrite.string_write import replace_combined_updated_blocks, replace_nulls_with_tilde_in_string
+from ..date_helper.date_helper import update_dates_in_data
+from ..yaml_toplevel.yaml_toplevel import get_toplevel_inserts_keys, determine_key_contents
+from ..yaml_list_helpers.yaml_list_helpers import get_last_list_index_for_key, get_list_item_key_values
+from ..yaml_dict_helpers.yaml_dict_helpers import get_dict_item_key_values
+from ..filereadwrite.file_indicies import find_yaml_block_indices_for_combined
+from ..filereadwrite.string_write import replace_combined_updated_blocks, replace_nulls_with_tilde_in_string
 
 def run_preservelast_pipeline(replacements_dir, manifests_file):
 
@@ -1,6 +1,6 @@
 from typing import Dict, List, Any
-from dasel.dasel_helpers import dasel_read
-from yaml_gen_helpers.parse import parse_yaml_value
+from ..dasel.dasel_helpers import dasel_read
+from ..yaml_gen_helpers.parse import parse_yaml_value
 
 def get_dict_item_key_values(manifest_file: str, keys: List[str]) -> Dict[str, List[Dict[str, Any]]]:
     """
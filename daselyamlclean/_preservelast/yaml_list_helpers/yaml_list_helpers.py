@@ -1,6 +1,6 @@
 from typing import Dict, List, Any
-from dasel.dasel_helpers import dasel_read, dasel_last_index_for_key
-from yaml_gen_helpers.parse import parse_yaml_value
+from ..dasel.dasel_helpers import dasel_read, dasel_last_index_for_key
+from ..yaml_gen_helpers.parse import parse_yaml_value
 
 def get_last_list_index_for_key(manifest_file, keys):
     """
@@ -1,4 +1,4 @@
-from dasel.dasel_helpers import dasel_read
+from ..dasel.dasel_helpers import dasel_read
 import re
 
 def get_toplevel_inserts_keys(file_path):
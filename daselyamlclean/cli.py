@@ -0,0 +1,104 @@
+import argparse
+import importlib
+
+# Subcommand name -> module providing its `run(args)` entry point.
+# Modules are only imported once their subcommand is dispatched, so the
+# YAML parser, dasel wrappers, diff and validation helpers stay off the
+# startup path (and out of `--help`).
+COMMANDS = {
+    "autoupdate": "daselyamlclean.autoupdate",
+    "manifestreplace": "daselyamlclean.manifestreplace",
+    "preservelast": "daselyamlclean.preservelast",
+}
+
+# Cold start budget checked by `--import-time`, in milliseconds.
+IMPORT_TIME_BUDGET_MS = 100.0
+
+# Number of child interpreters `--import-time` samples by default.
+IMPORT_TIME_REPEAT = 5
+
+def build_parser(progs=None):
+    """
+    Builds the argument parser for the `daselyamlclean` entry point.
+    Argument definitions live here rather than in the subcommand modules
+    so that parsing never has to import them.
+    `progs` optionally maps a subcommand name to the program name shown in
+    its usage text (used by the legacy per-use-case scripts).
+    """
+    progs = progs or {}
+    parser = argparse.ArgumentParser(
+        prog="daselyamlclean",
+        description="Wrapper tools for dasel to update YAML manifests"
+    )
+    parser.add_argument('--import-time', nargs='?', const='', metavar='COMMAND',
+                        help="Report cold start import time for the entry point "
+                             "(plus COMMAND's modules, if given) and exit")
+    parser.add_argument('--import-budget-ms', type=float, default=IMPORT_TIME_BUDGET_MS,
+                        help=f"Budget for --import-time in milliseconds (default: {IMPORT_TIME_BUDGET_MS})")
+    parser.add_argument('--repeat', type=int, default=IMPORT_TIME_REPEAT,
+                        help=f"Number of runs --import-time takes the median of (default: {IMPORT_TIME_REPEAT})")
+    subparsers = parser.add_subparsers(dest='command', metavar='COMMAND')
+
+    autoupdate = subparsers.add_parser(
+        'autoupdate', prog=progs.get('autoupdate'), help="Resolve datecode replacements and append block inserts"
+    )
+    autoupdate.add_argument('subcommand', choices=['put'],
+                            help="Subcommand: 'put' (currently the only supported action)")
+    autoupdate.add_argument('manifest_file',
+                            help="Path to the target manifest YAML file (e.g. repo/manifest-01/manifest.yaml)")
+    autoupdate.add_argument('--updates_dir',
+                            help="Directory containing replacements.yaml and inserts.yaml")
+
+    manifestreplace = subparsers.add_parser(
+        'manifestreplace', prog=progs.get('manifestreplace'), help="Update/insert values from a values file into a manifest"
+    )
+    manifestreplace.add_argument('subcommand', choices=['put'],
+                                 help="Subcommand: 'put' (currently the only supported action)")
+    manifestreplace.add_argument('values_file',
+                                 help="Relative or absolute path to the values YAML file (e.g. ./repo/values/manifest-01-values.yaml)")
+    manifestreplace.add_argument('manifest_file',
+                                 help="Relative or absolute path to the target manifest YAML file (e.g. ./repo/manifest-01/manifest.yaml)")
+
+    preservelast = subparsers.add_parser(
+        'preservelast', prog=progs.get('preservelast'), help="Bump dates on the last list items while preserving file layout"
+    )
+    preservelast.add_argument('subcommand', choices=['put'],
+                              help="Subcommand: 'put' (currently the only supported action)")
+    preservelast.add_argument('manifest_file',
+                              help="Path to the target manifest YAML file (e.g. repo/manifest-01/manifest.yaml)")
+    preservelast.add_argument('--replacements_dir',
+                              help="Directory containing inserts.yaml and updates.yaml")
+
+    return parser
+
+def main(argv=None, prog=None):
+    """
+    Console entry point. Parses argv, then imports and runs only the
+    module backing the selected subcommand. Returns the process exit code.
+    If `prog` is given it replaces the subcommand's name in usage messages.
+    """
+    progs = {argv[0]: prog} if prog and argv else None
+    parser = build_parser(progs)
+    args = parser.parse_args(argv)
+
+    if args.import_time is not None:
+        if args.import_time and args.import_time not in COMMANDS:
+            parser.error(f"--import-time: unknown command '{args.import_time}' "
+                         f"(choose from {', '.join(COMMANDS)})")
+        modules = ["daselyamlclean.cli"]
+        if args.import_time:
+            modules.append(COMMANDS[args.import_time])
+        if args.repeat < 1:
+            parser.error("--repeat must be at least 1")
+        from daselyamlclean.importtime import report_import_time
+        try:
+            return report_import_time(modules, args.import_budget_ms, repeat=args.repeat)
+        except RuntimeError as e:
+            parser.exit(2, f"{parser.prog}: error: {e}\n")
+
+    if args.command is None:
+        parser.print_help()
+        return 1
+
+    module = importlib.import_module(COMMANDS[args.command])
+    return module.run(args)
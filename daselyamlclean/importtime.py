@@ -0,0 +1,87 @@
+import os
+import statistics
+import subprocess
+import sys
+
+# Written to stderr by the child interpreter right before the measured imports,
+# separating them from the interpreter's own startup imports.
+START_MARKER = "-- daselyamlclean import start --"
+
+def parse_import_time(stderr):
+    """
+    Parses `-X importtime` output and returns one
+    (self_us, cumulative_us, depth, name) tuple per module reported after
+    START_MARKER, in the order they were reported.
+    Interpreter startup imports (site, encodings, ...) before the marker
+    and the column header line are skipped.
+    """
+    rows = []
+    started = False
+    for line in stderr.splitlines():
+        if line == START_MARKER:
+            started = True
+            continue
+        if not started or not line.startswith("import time:"):
+            continue
+        self_us, cumulative_us, name = line[len("import time:"):].split("|", 2)
+        if not self_us.strip().isdigit():
+            continue
+        # Nested imports are indented by two spaces per level after the leading space.
+        depth = (len(name) - len(name.lstrip()) - 1) // 2
+        rows.append((int(self_us), int(cumulative_us), depth, name.strip()))
+    return rows
+
+def total_ms(rows):
+    """Returns the total import time of `rows` in milliseconds (top-level cumulative times)."""
+    return sum(cumulative_us for _, cumulative_us, depth, _ in rows if depth == 0) / 1000
+
+def measure_import_time(modules):
+    """
+    Imports `modules` in a fresh interpreter run with `-X importtime`
+    and returns the parsed rows (see parse_import_time).
+    Raises RuntimeError with the child's stderr if the import fails.
+    """
+    code = "; ".join(
+        ["import sys", f"sys.stderr.write({START_MARKER!r} + '\\n')"]
+        + [f"import {module}" for module in modules]
+    )
+    env = dict(os.environ)
+    # Let the child resolve the same packages as this process, installed or not.
+    env["PYTHONPATH"] = os.pathsep.join(path for path in sys.path if path)
+    cmd = [sys.executable, "-X", "importtime", "-c", code]
+    result = subprocess.run(cmd, capture_output=True, text=True, env=env)
+    if result.returncode != 0:
+        # Keep only the traceback, not the importtime lines interleaved with it.
+        stderr = "\n".join(
+            line for line in result.stderr.splitlines()
+            if not line.startswith("import time:") and line != START_MARKER
+        )
+        raise RuntimeError(f"failed to import {', '.join(modules)}:\n{stderr.strip()}")
+    return parse_import_time(result.stderr)
+
+def report_import_time(modules, budget_ms, repeat=5, top=10):
+    """
+    Imports `modules` in `repeat` fresh interpreters and prints the median
+    cold start import time, the slowest modules of the median run by self
+    time, and a PASS or FAIL line comparing the median against `budget_ms`.
+    Returns 0 if the median is within budget, 1 otherwise.
+    """
+    runs = sorted((measure_import_time(modules) for _ in range(repeat)), key=total_ms)
+    totals = [total_ms(rows) for rows in runs]
+    median_ms = statistics.median(totals)
+    rows = runs[(len(runs) - 1) // 2]
+
+    print(f"Import time for: {', '.join(modules)}")
+    print(f"Runs: {repeat} (min {totals[0]:.2f} ms, median {median_ms:.2f} ms, max {totals[-1]:.2f} ms)")
+    print(f"Modules imported: {len(rows)}")
+    print(f"Slowest {min(top, len(rows))} by self time (median run):")
+    for self_us, cumulative_us, _, name in sorted(rows, reverse=True)[:top]:
+        print(f"  {self_us / 1000:8.2f} ms self {cumulative_us / 1000:8.2f} ms cumulative  {name}")
+
+    border = "*" * 40
+    summary = f"median {median_ms:.2f} ms (budget {budget_ms:.2f} ms)"
+    if median_ms <= budget_ms:
+        print(f"\n{border}\nPASS: {summary}\n{border}\n")
+        return 0
+    print(f"\n{border}\nFAIL: {summary}\n{border}\n")
+    return 1
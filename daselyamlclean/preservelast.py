@@ -0,0 +1,30 @@
+from daselyamlclean._preservelast.pipeline.run_preservelast_pipeline import run_preservelast_pipeline
+from daselyamlclean._preservelast.filereadwrite.create_backup import create_backup
+from daselyamlclean._preservelast.filereadwrite.show_diff import show_diff
+from daselyamlclean._preservelast.dasel.dasel_helpers import dasel_validate
+from daselyamlclean._preservelast.filereadwrite.file_write import apply_pipeline_result
+
+def run(args):
+    """
+    Entry point for the `preservelast` subcommand.
+    Runs the preservelast pipeline against args.manifest_file using the
+    inserts/updates in args.replacements_dir, validates and diffs the result,
+    then writes it back to the manifest.
+    """
+    if not args.replacements_dir:
+        print("Error: --replacements_dir must be provided")
+        return 1
+
+    backup_file = create_backup(args.manifest_file)
+
+    pipeline_result = run_preservelast_pipeline(
+        args.replacements_dir,
+        args.manifest_file
+        )
+
+    dasel_validate(pipeline_result)
+
+    show_diff(backup_file, pipeline_result)
+
+    apply_pipeline_result(args.manifest_file, pipeline_result, backup_file)
+    return 0
@@ -0,0 +1,92 @@
+import json
+import os
+import subprocess
+import sys
+import types
+
+import pytest
+
+from daselyamlclean import cli
+from daselyamlclean.importtime import START_MARKER, parse_import_time, total_ms
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Modules that must stay off the startup path until a subcommand runs.
+ENGINE_MODULES = [
+    "yaml",
+    "subprocess",
+    "daselyamlclean.autoupdate",
+    "daselyamlclean.manifestreplace",
+    "daselyamlclean.preservelast",
+    "daselyamlclean._preservelast",
+]
+
+def loaded_after(argv):
+    """Parses `argv` with the CLI parser in a fresh interpreter and returns which ENGINE_MODULES got imported."""
+    code = (
+        "import json, sys\n"
+        "from daselyamlclean.cli import build_parser\n"
+        f"build_parser().parse_args({argv!r})\n"
+        f"print(json.dumps([m for m in {ENGINE_MODULES!r} if m in sys.modules]))\n"
+    )
+    env = dict(os.environ, PYTHONPATH=REPO_ROOT)
+    result = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, env=env, check=True)
+    return json.loads(result.stdout)
+
+@pytest.mark.parametrize("argv", [
+    [],
+    ["autoupdate", "put", "manifest.yaml", "--updates_dir", "replacements"],
+    ["manifestreplace", "put", "values.yaml", "manifest.yaml"],
+    ["preservelast", "put", "manifest.yaml", "--replacements_dir", "replacements"],
+])
+def test_parsing_does_not_import_engine_modules(argv):
+    assert loaded_after(argv) == []
+
+def test_dispatch_imports_only_selected_command(monkeypatch):
+    calls = []
+    stub = types.ModuleType("stub_command")
+    stub.run = lambda args: calls.append(args) or 7
+    monkeypatch.setitem(sys.modules, "stub_command", stub)
+    monkeypatch.setitem(cli.COMMANDS, "autoupdate", "stub_command")
+
+    assert cli.main(["autoupdate", "put", "manifest.yaml", "--updates_dir", "replacements"]) == 7
+    assert len(calls) == 1
+    assert calls[0].manifest_file == "manifest.yaml"
+    assert calls[0].updates_dir == "replacements"
+
+def test_prog_replaces_subcommand_usage_name(capsys):
+    with pytest.raises(SystemExit):
+        cli.main(["autoupdate", "--help"], prog="autoupdater")
+    assert capsys.readouterr().out.startswith("usage: autoupdater ")
+
+def test_import_time_failure_exits_with_child_error(monkeypatch, capsys):
+    monkeypatch.setitem(cli.COMMANDS, "autoupdate", "daselyamlclean.does_not_exist")
+    with pytest.raises(SystemExit) as exc_info:
+        cli.main(["--import-time", "autoupdate", "--repeat", "1"])
+    assert exc_info.value.code == 2
+    err = capsys.readouterr().err
+    assert "failed to import" in err
+    assert "ModuleNotFoundError" in err
+
+def test_parse_import_time_skips_startup_and_header():
+    stderr = "\n".join([
+        "import time: self [us] | cumulative | imported package",
+        "import time:       100 |        100 |   _io",
+        "import time:       200 |        300 | site",
+        START_MARKER,
+        "import time:        50 |         50 |     _weakrefset",
+        "import time:       400 |        450 |   argparse",
+        "import time:        30 |        480 | daselyamlclean.cli",
+        "import time:        20 |         20 | daselyamlclean",
+    ])
+    rows = parse_import_time(stderr)
+    assert rows == [
+        (50, 50, 2, "_weakrefset"),
+        (400, 450, 1, "argparse"),
+        (30, 480, 0, "daselyamlclean.cli"),
+        (20, 20, 0, "daselyamlclean"),
+    ]
+    assert total_ms(rows) == 0.5
+
+def test_parse_import_time_without_marker_is_empty():
+    assert parse_import_time("import time:       100 |        100 | site") == []